@@ -1,9 +1,19 @@
 import streamlit as st
 import pandas as pd
 import os
-import json
+import csv
+import io
+import shutil
+import time
+import threading
+import importlib.util
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import pyarrow as pa
+import pyarrow.parquet as pq
+from foundation_data_v2.utils.file_utils import read_picklist_csv
+from foundation_data_v2.utils.json_utils import dumps_json, loads_json
 
 # 🌐 Base directories for each mode
 BASE_DIR = {
@@ -11,11 +21,105 @@ BASE_DIR = {
     "payroll": "payroll_configs"
 }
 
-# ✅ Get config paths
-def get_paths(mode: str) -> Optional[Dict[str, str]]:
-    if mode not in BASE_DIR:
-        st.error(f"❌ Invalid mode: {mode}")
-        return None
+# 📌 Source files and template types offered per mode
+SOURCE_FILES = {
+    "foundation": ("HRP1000", "HRP1001"),
+    "payroll": ("PA0008", "PA0014")
+}
+TEMPLATE_TYPES = {
+    "foundation": ("Level", "Association"),
+    "payroll": ("PA0008", "PA0014")
+}
+
+# ⚡ Short-lived cache for exists/listdir/mtime lookups. Reruns come in bursts, and on
+# network mounts every stat is a round trip; writers call invalidate() for their path.
+FS_CACHE_TTL = 2.0
+
+# ✅ Sorted .csv file names in a directory, filtered during the scan
+def _scan_csv(path: str) -> tuple:
+    with os.scandir(path) as entries:
+        return tuple(sorted(e.name for e in entries if e.name.endswith(".csv") and e.is_file()))
+
+class _FsCache:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, op: str, path: str, compute):
+        key = (op, os.fspath(path))
+        now = time.monotonic()
+        with self._lock:
+            hit = self._entries.get(key)
+        if hit is not None and now - hit[0] < self.ttl:
+            return hit[1]
+        value = compute(path)
+        with self._lock:
+            self._entries[key] = (now, value)
+        return value
+
+    def exists(self, path: str) -> bool:
+        return self._lookup("exists", path, os.path.exists)
+
+    def listdir(self, path: str) -> List[str]:
+        return list(self._lookup("listdir", path, lambda p: tuple(os.listdir(p))))
+
+    def list_csv(self, path: str) -> List[str]:
+        return list(self._lookup("list_csv", path, _scan_csv))
+
+    def getmtime_ns(self, path: str) -> int:
+        return self._lookup("mtime", path, lambda p: os.stat(p).st_mtime_ns)
+
+    def invalidate(self, path: str) -> None:
+        """Drop cached results for a path and for its directory listing."""
+        path = os.fspath(path)
+        stale = {path, os.path.dirname(path)}
+        with self._lock:
+            for key in [k for k in self._entries if k[1] in stale]:
+                del self._entries[key]
+
+_fs = _FsCache(FS_CACHE_TTL)
+
+# ✅ Replace a file atomically: readers see the old bytes or the new ones, never a torn write.
+# The temp name is unique per process and thread, since sessions save concurrently.
+def _atomic_write_bytes(path: str, data: bytes) -> None:
+    tmp = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    _fs.invalidate(path)
+
+# ✅ JSON config I/O (2-space indented, bytes straight to disk)
+def _json_dump(obj, path: str) -> None:
+    _atomic_write_bytes(path, dumps_json(obj, indent=True))
+
+def _json_load(path: str):
+    return loads_json(Path(path).read_bytes())
+
+# ✅ Load a JSON config, or fall back to a default if it's missing or unreadable (one open, no exists probe)
+def _load_json_or(path: str, default):
+    try:
+        return _json_load(path)
+    except (OSError, ValueError):
+        return default
+
+# 📦 Samples are stored as Parquet: typed, compressed, and the column list is in the footer
+SAMPLE_EXT = ".parquet"
+# 📌 Samples saved before the switch to Parquet; still read until a new upload replaces them
+LEGACY_SAMPLE_EXT = ".csv"
+CSV_CHUNK_ROWS = 100_000
+
+# ✅ Get config paths (built once per mode; KeyError for an unknown mode).
+# The dict is shared between callers, so treat it as read-only.
+@lru_cache(maxsize=8)
+def _compute_paths(mode: str) -> Dict[str, str]:
     base = BASE_DIR[mode]
     return {
         "CONFIG_DIR": os.path.join(base, "configs"),
@@ -23,72 +127,231 @@ def get_paths(mode: str) -> Optional[Dict[str, str]]:
         "SAMPLES_DIR": os.path.join(base, "source_samples")
     }
 
+def get_paths(mode: str) -> Optional[Dict[str, str]]:
+    try:
+        return _compute_paths(mode)
+    except KeyError:
+        st.error(f"❌ Invalid mode: {mode}")
+        return None
+
+# 📌 Paths of modes whose directories exist; filled by initialize_directories
+_PATH_CACHE: Dict[str, Dict[str, str]] = {}
+
 # ✅ Ensure directories exist
 def initialize_directories(mode: str) -> None:
+    # Once a mode's directories exist in this process, reruns skip the mkdir probes
+    if mode in _PATH_CACHE:
+        return
     paths = get_paths(mode)
     if not paths:
         return
     for path in paths.values():
         Path(path).mkdir(parents=True, exist_ok=True)
+    _PATH_CACHE[mode] = paths
+
+def _mode_paths(mode: str) -> Dict[str, str]:
+    if mode not in _PATH_CACHE:
+        initialize_directories(mode)
+    return _PATH_CACHE[mode]
+
+# ⚡ Per-mode filename templates, joined once, so building a config path is a single str.format.
+# Built from _mode_paths, so the mode's directories exist before any path is handed out.
+@lru_cache(maxsize=8)
+def _path_formats(mode: str) -> Dict[str, str]:
+    paths = _mode_paths(mode)
+    return {
+        "sample": os.path.join(paths["SAMPLES_DIR"], "{}" + SAMPLE_EXT),
+        "legacy_sample": os.path.join(paths["SAMPLES_DIR"], "{}" + LEGACY_SAMPLE_EXT),
+        "template_csv": os.path.join(paths["CONFIG_DIR"], "{}_destination_template.csv"),
+        "template_json": os.path.join(paths["CONFIG_DIR"], "{}_destination_template.json"),
+        "mapping": os.path.join(paths["CONFIG_DIR"], "{}_column_mapping.json"),
+        "picklist": os.path.join(paths["PICKLIST_DIR"], "{}")
+    }
+
+def mode_path(mode: str, kind: str, name: str) -> str:
+    return _path_formats(mode)[kind].format(name)
+
+# ⚡ Excel engines are only looked up when an .xlsx actually arrives; most uploads are CSV.
+# python-calamine parses .xlsx much faster than openpyxl, so it wins when installed.
+@lru_cache(maxsize=1)
+def _excel_engine() -> str:
+    if importlib.util.find_spec("python_calamine") is not None:
+        return "calamine"
+    return "openpyxl"
+
+# ✅ Uploads are told apart by content, not name: .xlsx workbooks are zip archives
+XLSX_MAGIC = b"PK\x03\x04"
+
+def _is_xlsx(data: bytes) -> bool:
+    return data[:4] == XLSX_MAGIC
+
+# ✅ Parse an uploaded sample once per upload (reruns hit the cache)
+@st.cache_data(show_spinner=False)
+def _read_upload(data: bytes) -> pd.DataFrame:
+    if not _is_xlsx(data):
+        return pd.read_csv(io.BytesIO(data))
+    return pd.read_excel(io.BytesIO(data), engine=_excel_engine())
+
+# ✅ Column names of a saved sample: Parquet schema (or a legacy CSV's header row) only,
+# cached per (path, mtime)
+@st.cache_data(show_spinner=False)
+def _sample_columns(path: str, mtime_ns: int) -> Tuple[str, ...]:
+    if path.endswith(LEGACY_SAMPLE_EXT):
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            return tuple(next(csv.reader(f), []))
+    return tuple(pq.read_schema(path).names)
+
+# ✅ The saved sample for a source file: the Parquet one, else a pre-Parquet CSV sample
+def _saved_sample_path(mode: str, name: str) -> str:
+    path = mode_path(mode, "sample", name)
+    if _fs.exists(path):
+        return path
+    legacy_path = mode_path(mode, "legacy_sample", name)
+    return legacy_path if _fs.exists(legacy_path) else path
+
+# ⚡ DEFAULT_TEMPLATES never changes at runtime, so each one is rendered to CSV bytes only once
+@lru_cache(maxsize=None)
+def _default_template_csv(file_key: str) -> Optional[bytes]:
+    rows = DEFAULT_TEMPLATES.get(file_key)
+    if not rows:
+        return None
+    return pd.DataFrame(rows).to_csv(index=False).encode("utf-8")
+
+# ✅ Write the default destination template for a file; False if there is none
+def _write_default_template(file_key: str, path: str) -> bool:
+    data = _default_template_csv(file_key)
+    if data is None:
+        return False
+    _atomic_write_bytes(path, data)
+    return True
+
+# ✅ Persist a sample as Parquet; mixed-type object columns are stored as text
+def _write_sample(df: pd.DataFrame, path: str) -> None:
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        object_cols = df.select_dtypes(include=["object"]).columns
+        table = pa.Table.from_pandas(df.astype({col: str for col in object_cols}), preserve_index=False)
+    pq.write_table(table, path, compression="zstd")
+    _fs.invalidate(path)
+
+# ✅ Stream an uploaded CSV into a Parquet sample chunk by chunk; returns its columns.
+# Every column is read as text so all chunks share one schema. Chunks go to a temp file
+# that only replaces the saved sample once the whole upload has parsed.
+def _write_csv_sample(uploaded_file, path: str) -> List[str]:
+    uploaded_file.seek(0)
+    tmp = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    writer = None
+    try:
+        with pd.read_csv(uploaded_file, chunksize=CSV_CHUNK_ROWS, dtype=str) as reader:
+            for chunk in reader:
+                if writer is None:
+                    schema = pa.schema([(str(col), pa.string()) for col in chunk.columns])
+                    writer = pq.ParquetWriter(tmp, schema, compression="zstd")
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+        writer.close()
+        writer = None
+        os.replace(tmp, path)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    _fs.invalidate(path)
+    return schema.names
+
+# ✅ Persist an uploaded sample; CSVs never become a full DataFrame. Returns its columns.
+def _save_uploaded_sample(uploaded_file, path: str) -> List[str]:
+    data = uploaded_file.getvalue()
+    if not _is_xlsx(data):
+        return _write_csv_sample(uploaded_file, path)
+    df = _read_upload(data)
+    _write_sample(df, path)
+    return df.columns.tolist()
+
 # ✅ Upload and save sample files
 def handle_sample_upload(mode: str):
     st.subheader("📁 Upload Sample Files")
 
-    source_options = ["PA0008", "PA0014"] if mode == "payroll" else ["HRP1000", "HRP1001"]
+    source_options = SOURCE_FILES.get(mode, SOURCE_FILES["foundation"])
     selected_file = st.radio("Choose file type:", source_options, horizontal=True, key=f"upload_type_{mode}")
     
     uploaded_file = st.file_uploader("Upload CSV or Excel", type=["csv", "xlsx"], key=f"{selected_file}_{mode}_upload")
 
     if uploaded_file:
-        df = pd.read_csv(uploaded_file) if uploaded_file.name.endswith(".csv") else pd.read_excel(uploaded_file)
         paths = get_paths(mode)
         if not paths:
             st.error("❌ Invalid config path.")
             return
 
-        sample_path = os.path.join(paths["SAMPLES_DIR"], f"{selected_file}.csv")
-        df.to_csv(sample_path, index=False)
+        sample_path = mode_path(mode, "sample", selected_file)
+        # The uploader keeps its file across reruns; only write the sample once per upload
+        saved_key = f"{selected_file}_{mode}_saved_upload"
+        sample_columns = None
+        if st.session_state.get(saved_key) != uploaded_file.file_id:
+            try:
+                sample_columns = _save_uploaded_sample(uploaded_file, sample_path)
+            except Exception as e:
+                st.error(f"❌ Could not read {uploaded_file.name}: {e}")
+                return
+            st.session_state[saved_key] = uploaded_file.file_id
         st.success(f"✅ {selected_file} sample saved to {sample_path}")
 
+        # Existence checks that guard a write go to disk, not through the TTL cache:
+        # a file another session just created must not be overwritten
         # Auto-generate destination template if not found
-        template_path = os.path.join(paths["CONFIG_DIR"], f"{selected_file}_destination_template.csv")
+        template_path = mode_path(mode, "template_csv", selected_file)
         if not os.path.exists(template_path):
-            default_template = DEFAULT_TEMPLATES.get(selected_file, [])
-            if default_template:
-                pd.DataFrame(default_template).to_csv(template_path, index=False)
+            if _write_default_template(selected_file, template_path):
                 st.success(f"✅ Destination template created for {selected_file}")
+            else:
+                st.warning(f"No default template found for {selected_file}")
 
         # Auto-generate column mapping if not found
-        mapping_path = os.path.join(paths["CONFIG_DIR"], f"{selected_file}_column_mapping.json")
+        mapping_path = mode_path(mode, "mapping", selected_file)
         if not os.path.exists(mapping_path):
+            if sample_columns is None:
+                sample_columns = _sample_columns(sample_path, _fs.getmtime_ns(sample_path))
             default_mapping = [
                 {
                     "source_column": col,
                     "destination_column": col,
                     "transformation": "None"
-                } for col in df.columns
+                } for col in sample_columns
             ]
-            with open(mapping_path, "w") as f:
-                json.dump(default_mapping, f, indent=2)
+            _json_dump(default_mapping, mapping_path)
             st.success(f"✅ Column mapping file created for {selected_file}")
 # ✅ Text ⇄ Template Conversion
+TEMPLATE_FIELDS = ["target_column1", "target_column2", "description"]
+
+# Vectorized with pandas string ops rather than read_csv: rows may carry extra fields,
+# which read_csv rejects, and they should just be ignored as before
 def convert_text_to_template(text_input: str) -> List[Dict]:
-    lines = [line.strip() for line in text_input.split('\n') if line.strip()]
-    template = []
-    for line in lines:
-        parts = [part.strip() for part in line.split(',')]
-        if len(parts) >= 2:
-            template.append({
-                "target_column1": parts[0],
-                "target_column2": parts[1],
-                "description": parts[2] if len(parts) > 2 else ""
-            })
-    return template
+    lines = pd.Series(text_input.split('\n'), dtype=str).str.strip()
+    parts = lines[lines != ""].str.split(",", expand=True).reindex(columns=range(3))
+    parts = parts[parts[1].notna()].fillna("").astype(str)
+    template = parts.apply(lambda col: col.str.strip())
+    template.columns = TEMPLATE_FIELDS
+    return template.to_dict("records")
+
+# Memoized on the row values, so reruns of the Text view with an unchanged template skip pandas
+@lru_cache(maxsize=32)
+def _template_rows_to_text(rows: Tuple[tuple, ...]) -> str:
+    df = pd.DataFrame(list(rows), columns=TEMPLATE_FIELDS).fillna("").astype(str)
+    return '\n'.join(df["target_column1"].str.cat([df["target_column2"], df["description"]], sep=","))
 
 def convert_template_to_text(template: List[Dict]) -> str:
-    return '\n'.join([
-        f"{row['target_column1']},{row['target_column2']},{row.get('description', '')}" for row in template
-    ])
+    if not template:
+        return ""
+    return _template_rows_to_text(tuple(tuple(row.get(field) for field in TEMPLATE_FIELDS) for row in template))
+
+# ✅ Parse a picklist once per (path, mtime); switching between unchanged picklists is a cache hit
+@st.cache_data(show_spinner=False)
+def _read_picklist(path: str, mtime_ns: int) -> pd.DataFrame:
+    return read_picklist_csv(path)
 
 # ✅ Picklist Management UI
 def manage_picklists(mode: str):
@@ -100,80 +363,115 @@ def manage_picklists(mode: str):
 
     uploaded = st.file_uploader("Upload Picklist (.csv)", type=["csv"], key=f"picklist_upload_{mode}")
     if uploaded:
-        save_path = os.path.join(picklist_dir, uploaded.name)
+        save_path = mode_path(mode, "picklist", uploaded.name)
+        uploaded.seek(0)
         with open(save_path, "wb") as f:
-            f.write(uploaded.getbuffer())
+            shutil.copyfileobj(uploaded, f, 1024 * 1024)
+        _fs.invalidate(save_path)
         st.success(f"✅ Uploaded: {uploaded.name}")
         st.rerun()
 
-    picklist_files = [f for f in os.listdir(picklist_dir) if f.endswith(".csv")]
+    picklist_files = _fs.list_csv(picklist_dir)
     if picklist_files:
         selected = st.selectbox("Edit Picklist", picklist_files, key=f"picklist_select_{mode}")
-        file_path = os.path.join(picklist_dir, selected)
+        file_path = mode_path(mode, "picklist", selected)
 
         try:
-            df = pd.read_csv(file_path)
+            df = _read_picklist(file_path, _fs.getmtime_ns(file_path))
             edited = st.data_editor(df, num_rows="dynamic", use_container_width=True)
             if st.button("💾 Save Picklist", key=f"save_picklist_btn_{mode}"):
                 edited.to_csv(file_path, index=False)
+                _fs.invalidate(file_path)
                 st.success(f"{selected} saved.")
         except Exception as e:
             st.error(f"⚠️ Could not read file: {e}")
     else:
         st.info("No picklists found.")
+# ✅ Grid editor state: the rows, plus the base rows the grid was created from.
+# st.data_editor diffs its edits against that base, so the base only changes when the
+# grid is re-keyed (new version) alongside it.
+def _reset_editor(state_key: str, rows: List[Dict]) -> None:
+    st.session_state[state_key] = rows
+    st.session_state[f"{state_key}_base"] = [dict(row) for row in rows]
+    st.session_state[f"{state_key}_version"] = st.session_state.get(f"{state_key}_version", 0) + 1
+
+# ✅ Seed a grid from its JSON file; later reruns reuse the in-memory rows unless the file's
+# mtime has changed since they were loaded or saved, so the JSON is not parsed again
+def _file_mtime_ns(path: str) -> Optional[int]:
+    try:
+        return _fs.getmtime_ns(path)
+    except FileNotFoundError:
+        return None
+
+def _load_editor_rows(state_key: str, path: str, default: List[Dict]) -> None:
+    mtime = _file_mtime_ns(path)
+    if state_key in st.session_state and st.session_state.get(f"{state_key}_mtime") == mtime:
+        return
+    _reset_editor(state_key, [dict(row) for row in _load_json_or(path, default)])
+    st.session_state[f"{state_key}_mtime"] = mtime
+
+def _save_editor_rows(state_key: str, path: str) -> None:
+    _json_dump(st.session_state[state_key], path)
+    st.session_state[f"{state_key}_mtime"] = _file_mtime_ns(path)
+
+def _editor_grid(state_key: str, columns: List[str], column_config: Dict) -> pd.DataFrame:
+    return st.data_editor(
+        pd.DataFrame(st.session_state[f"{state_key}_base"], columns=columns),
+        num_rows="dynamic",
+        hide_index=True,
+        use_container_width=True,
+        column_config=column_config,
+        key=f"{state_key}_grid_{st.session_state[f'{state_key}_version']}"
+    )
+
 # ✅ Destination Template Editor
 def render_template_editor(template_type: str, mode: str):
     st.subheader(f"🧾 Destination Template – {template_type}")
     paths = get_paths(mode)
-    config_path = os.path.join(paths["CONFIG_DIR"], f"{template_type}_destination_template.json")
+    config_path = mode_path(mode, "template_json", template_type)
     default_template = DEFAULT_TEMPLATES.get(template_type.lower(), [])
+    state_key = f"{template_type}_template_{mode}"
 
     # Load existing or default
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, "r") as f:
-                template = json.load(f)
-        except:
-            template = default_template
-    else:
-        template = default_template
-
-    if f"{template_type}_template_{mode}" not in st.session_state:
-        st.session_state[f"{template_type}_template_{mode}"] = template.copy()
+    _load_editor_rows(state_key, config_path, default_template)
 
     edit_mode = st.radio("Edit Mode", ["Table", "Text"], horizontal=True, key=f"{template_type}_edit_mode_{mode}")
 
     if st.button("Reset to Default", key=f"reset_{template_type}_{mode}"):
-        st.session_state[f"{template_type}_template_{mode}"] = default_template
-        with open(config_path, "w") as f:
-            json.dump(default_template, f, indent=2)
+        _reset_editor(state_key, [dict(row) for row in default_template])
+        _json_dump(default_template, config_path)
         st.success("Reset to default.")
         st.rerun()
 
     if edit_mode == "Table":
-        for i, row in enumerate(st.session_state[f"{template_type}_template_{mode}"]):
-            cols = st.columns([3, 3, 3, 1])
-            row["target_column1"] = cols[0].text_input("System Column", row["target_column1"], key=f"col1_{i}_{mode}", label_visibility="collapsed")
-            row["target_column2"] = cols[1].text_input("Display Name", row["target_column2"], key=f"col2_{i}_{mode}", label_visibility="collapsed")
-            row["description"] = cols[2].text_input("Description", row.get("description", ""), key=f"desc_{i}_{mode}", label_visibility="collapsed")
-            if cols[3].button("🗑️", key=f"del_{i}_{mode}"):
-                del st.session_state[f"{template_type}_template_{mode}"][i]
-                st.rerun()
+        edited = _editor_grid(state_key, TEMPLATE_FIELDS, {
+            "target_column1": st.column_config.TextColumn("System Column"),
+            "target_column2": st.column_config.TextColumn("Display Name"),
+            "description": st.column_config.TextColumn("Description")
+        })
+        st.session_state[state_key] = edited.fillna("").to_dict("records")
 
         if st.button("💾 Save Template", key=f"save_temp_btn_{template_type}_{mode}"):
-            with open(config_path, "w") as f:
-                json.dump(st.session_state[f"{template_type}_template_{mode}"], f, indent=2)
+            _save_editor_rows(state_key, config_path)
             st.success("✅ Template saved.")
     else:
-        text = st.text_area("Template CSV format", convert_template_to_text(st.session_state[f"{template_type}_template_{mode}"]), height=250)
+        # Hand the grid the current rows for when the user switches back
+        if st.session_state[f"{state_key}_base"] != st.session_state[state_key]:
+            _reset_editor(state_key, st.session_state[state_key])
+        text = st.text_area("Template CSV format", convert_template_to_text(st.session_state[state_key]), height=250)
         if st.button("Apply Text", key=f"apply_txt_{template_type}_{mode}"):
             try:
                 parsed = convert_text_to_template(text)
-                st.session_state[f"{template_type}_template_{mode}"] = parsed
+                _reset_editor(state_key, parsed)
                 st.success("Template updated.")
                 st.rerun()
             except Exception as e:
                 st.error(f"Parse error: {e}")
+# 📌 Transformation names, built once; the library is fixed after import
+@lru_cache(maxsize=1)
+def _transform_keys() -> Tuple[str, ...]:
+    return tuple(TRANSFORMATION_LIBRARY)
+
 def render_column_mapping_interface(mode: str):
     st.subheader("🔄 Column Mapping Interface")
 
@@ -182,56 +480,41 @@ def render_column_mapping_interface(mode: str):
         st.error("❌ Invalid mode or config path.")
         return
 
-    file_options = ["PA0008", "PA0014"] if mode == "payroll" else ["HRP1000", "HRP1001"]
+    file_options = SOURCE_FILES.get(mode, SOURCE_FILES["foundation"])
     source_file = st.selectbox("📁 Choose Source File", file_options, key=f"src_map_{mode}")
 
-    sample_path = os.path.join(paths["SAMPLES_DIR"], f"{source_file}.csv")
-    config_path = os.path.join(paths["CONFIG_DIR"], f"{source_file}_column_mapping.json")
+    sample_path = _saved_sample_path(mode, source_file)
+    config_path = mode_path(mode, "mapping", source_file)
 
-    if not os.path.exists(sample_path):
+    try:
+        source_columns = _sample_columns(sample_path, _fs.getmtime_ns(sample_path))
+    except FileNotFoundError:
         st.warning(f"⚠️ No sample for {source_file}. Upload it first.")
         return
-
-    try:
-        df = pd.read_csv(sample_path, nrows=MAX_SAMPLE_ROWS)
-        source_columns = df.columns.tolist()
     except Exception as e:
         st.error(f"Error reading sample: {e}")
         return
 
     # Load or init mapping
-    if f"mapping_{source_file}_{mode}" not in st.session_state:
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, "r") as f:
-                    st.session_state[f"mapping_{source_file}_{mode}"] = json.load(f)
-            except:
-                st.session_state[f"mapping_{source_file}_{mode}"] = []
-        else:
-            st.session_state[f"mapping_{source_file}_{mode}"] = []
-
-    mappings = st.session_state[f"mapping_{source_file}_{mode}"]
-
-    for i, mapping in enumerate(mappings):
-        cols = st.columns([3, 3, 3, 1])
-        mapping["source_column"] = cols[0].selectbox("Source", source_columns, index=source_columns.index(mapping["source_column"]) if mapping["source_column"] in source_columns else 0, key=f"{mode}_src_{i}", label_visibility="collapsed")
-        mapping["destination_column"] = cols[1].text_input("Destination", mapping["destination_column"], key=f"{mode}_dest_{i}", label_visibility="collapsed")
-        mapping["transformation"] = cols[2].selectbox("Transform", list(TRANSFORMATION_LIBRARY.keys()), index=list(TRANSFORMATION_LIBRARY.keys()).index(mapping.get("transformation", "None")), key=f"{mode}_trans_{i}", label_visibility="collapsed")
-        if cols[3].button("🗑️", key=f"{mode}_del_map_{i}"):
-            del mappings[i]
-            st.rerun()
-
-    if st.button("➕ Add Mapping", key=f"add_map_{mode}"):
-        mappings.append({
-            "source_column": source_columns[0] if source_columns else "",
-            "destination_column": "",
-            "transformation": "None"
-        })
+    state_key = f"mapping_{source_file}_{mode}"
+    _load_editor_rows(state_key, config_path, [])
+
+    # One grid for all mappings; rows are added and deleted in the grid itself
+    edited = _editor_grid(state_key, ["source_column", "destination_column", "transformation"], {
+        "source_column": st.column_config.SelectboxColumn(
+            "Source", options=source_columns, default=source_columns[0] if source_columns else None
+        ),
+        "destination_column": st.column_config.TextColumn("Destination", default=""),
+        "transformation": st.column_config.SelectboxColumn(
+            "Transform", options=_transform_keys(), default="None"
+        )
+    })
+    mappings = edited.fillna({"source_column": "", "destination_column": "", "transformation": "None"}).to_dict("records")
+    st.session_state[state_key] = mappings
 
     if st.button("💾 Save Mappings", key=f"save_map_{mode}"):
         try:
-            with open(config_path, "w") as f:
-                json.dump(mappings, f, indent=2)
+            _save_editor_rows(state_key, config_path)
             st.success("✅ Mappings saved!")
         except Exception as e:
             st.error(f"❌ Save error: {e}")
@@ -248,48 +531,11 @@ def show_admin_panel(mode: str = "foundation") -> None:
     ])
 
     with tab1:
-        st.subheader("📁 Upload Sample Files")
-        source_options = ["PA0008", "PA0014"] if mode == "payroll" else ["HRP1000", "HRP1001"]
-        selected_file_type = st.radio("Choose file type:", source_options, horizontal=True, key=f"src_type_{mode}")
-    
-        uploaded_file = st.file_uploader("Upload CSV or Excel", type=["csv", "xlsx"], key=f"{selected_file_type}_{mode}_upload")
-        
-        paths = get_paths(mode)
-        if not paths:
-            st.error("Invalid mode paths.")
-        elif uploaded_file:
-            df = pd.read_csv(uploaded_file) if uploaded_file.name.endswith(".csv") else pd.read_excel(uploaded_file)
-            
-            sample_path = os.path.join(paths["SAMPLES_DIR"], f"{selected_file_type}.csv")
-            df.to_csv(sample_path, index=False)
-            st.success(f"{selected_file_type} sample saved to {sample_path}.")
-    
-            # ✅ Auto-regenerate destination template if not found
-            dest_template_path = os.path.join(paths["CONFIG_DIR"], f"{selected_file_type}_destination_template.csv")
-            if not os.path.exists(dest_template_path):
-                if selected_file_type in DEFAULT_TEMPLATES:
-                    default_template_df = pd.DataFrame(DEFAULT_TEMPLATES[selected_file_type])
-                    default_template_df.to_csv(dest_template_path, index=False)
-                    st.success(f"✅ Destination template generated for {selected_file_type}")
-                else:
-                    st.warning(f"No default template found for {selected_file_type}")
-    
-            # ✅ Auto-regenerate column mapping if not found
-            mapping_path = os.path.join(paths["CONFIG_DIR"], f"{selected_file_type}_column_mapping.json")
-            if not os.path.exists(mapping_path):
-                default_mapping = [
-                    {
-                        "source_column": col,
-                        "destination_column": col,
-                        "transformation": "None"
-                    } for col in df.columns
-                ]
-                with open(mapping_path, "w") as f:
-                    json.dump(default_mapping, f, indent=4)
-                st.success(f"✅ Column mapping file generated for {selected_file_type}")
+        handle_sample_upload(mode)
 
     with tab2:
-        template_type = st.radio("Select Template Type", source_options if mode == "payroll" else ["Level", "Association"], horizontal=True, key=f"template_type_{mode}")
+        template_options = TEMPLATE_TYPES.get(mode, TEMPLATE_TYPES["foundation"])
+        template_type = st.radio("Select Template Type", template_options, horizontal=True, key=f"template_type_{mode}")
         render_template_editor(template_type, mode)
 
     with tab3:
@@ -299,33 +545,29 @@ def show_admin_panel(mode: str = "foundation") -> None:
         render_column_mapping_interface(mode)
 # ✅ Save functions
 def save_template(template_df: pd.DataFrame, file_key: str, mode: str):
-    path = os.path.join(f"{mode}_configs", "configs", f"{file_key}_destination_template.csv")
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    path = mode_path(mode, "template_csv", file_key)
     template_df.to_csv(path, index=False)
+    _fs.invalidate(path)
 
 def save_column_mapping(mapping: List[Dict], file_key: str, mode: str):
-    path = os.path.join(f"{mode}_configs", "configs", f"{file_key}_column_mapping.json")
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(mapping, f, indent=2)
+    path = mode_path(mode, "mapping", file_key)
+    _json_dump(mapping, path)
 
 def save_picklist(df: pd.DataFrame, filename: str, mode: str):
-    path = os.path.join(f"{mode}_configs", "picklists", filename)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    path = mode_path(mode, "picklist", filename)
     df.to_csv(path, index=False)
+    _fs.invalidate(path)
 
 # ✅ Regenerate if missing
 def regenerate_default_template(file_key: str, mode: str) -> None:
     """Create default template if missing."""
-    path = os.path.join(f"{mode}_configs", "configs", f"{file_key}_destination_template.csv")
+    path = mode_path(mode, "template_csv", file_key)
+    # A real stat: the TTL cache could hide a template another session just created
     if not os.path.exists(path):
-        default = DEFAULT_TEMPLATES.get(file_key.lower(), [])
-        df = pd.DataFrame(default)
-        df.to_csv(path, index=False)
+        _write_default_template(file_key.lower(), path)
 
 def regenerate_default_mapping(file_key: str, mode: str) -> None:
     """Create blank mapping file if missing."""
-    path = os.path.join(f"{mode}_configs", "configs", f"{file_key}_column_mapping.json")
+    path = mode_path(mode, "mapping", file_key)
     if not os.path.exists(path):
-        with open(path, "w") as f:
-            json.dump([], f, indent=2)
+        _json_dump([], path)
@@ -2,21 +2,68 @@ import streamlit as st
 import pandas as pd
 import os
 import json
+import csv
+import re
 from pathlib import Path
+from functools import lru_cache
 from foundation_data_v2.utils.hierarchy_utils import get_default_mappings
-from typing import List, Dict, Optional, Union
+from foundation_data_v2.utils.file_utils import read_picklist_csv
+from foundation_data_v2.utils.json_utils import dumps_json, loads_json
+from typing import BinaryIO, Iterable, List, Dict, Optional, Tuple, Union
 import io
+import threading
+import pyarrow.parquet as pq
+import shutil
+import chardet
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
 # Constants
 CONFIG_DIR = "configs"
 PICKLIST_DIR = "picklists"
 SOURCE_SAMPLES_DIR = "source_samples"
+CONFIG_PATH = Path(CONFIG_DIR)
+PICKLIST_PATH = Path(PICKLIST_DIR)
+SOURCE_SAMPLES_PATH = Path(SOURCE_SAMPLES_DIR)
 MAX_SAMPLE_ROWS = 1000
+# Samples are kept as Parquet: typed, compressed, and the column names sit in the footer
+SAMPLE_EXT = ".parquet"
+SAMPLE_COMPRESSION = "snappy"
+# Samples saved before the switch to Parquet; still read until a new upload replaces them
+LEGACY_SAMPLE_EXT = ".csv"
+SOURCE_FILE_TYPES = ("HRP1000", "HRP1001")
+APPLIES_TO_OPTIONS = ("Level", "Association", "Both")
+PICKLIST_PREVIEW_ROWS = 100
+PICKLIST_LOAD_WORKERS = 8
+# python-calamine (Rust) parses .xlsx several times faster than openpyxl; pandas only
+# needs it installed, so it is detected here without being imported
+EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else "openpyxl"
+# Write configs indented for hand inspection; compact output is smaller and faster
+PRETTY_CONFIG_JSON = False
+
+# Known SAP source columns, used until a sample file has been uploaded
+DEFAULT_SOURCE_COLUMNS = {
+    "HRP1000": ["Client", "Plan version", "Object type", "Object ID", "Planning status", "Start date", "End Date", "Name", "Object abbr."],
+    "HRP1001": ["Client", "Object type", "Source ID", "Plan version", "Relationship", "Planning status", "Start date", "End Date", "Target object ID"]
+}
+
+# Fields of a Level/Association template row, in editor order
+TEMPLATE_COLUMNS = ("target_column1", "target_column2", "description")
+
+# Templates are JSON lists; anything else can be rejected without parsing it
+_LEADING_BRACKET = re.compile(r"\s*\[")
+
+# Set once the directories have been created in this process
+_dirs_initialized = False
 
 def initialize_directories() -> None:
     """Ensure all required directories exist."""
-    for directory in [CONFIG_DIR, PICKLIST_DIR, SOURCE_SAMPLES_DIR]:
-        Path(directory).mkdir(exist_ok=True)
+    global _dirs_initialized
+    if _dirs_initialized:
+        return
+    for directory in (CONFIG_PATH, PICKLIST_PATH, SOURCE_SAMPLES_PATH):
+        directory.mkdir(exist_ok=True)
+    _dirs_initialized = True
 
 # Session State Integration Functions
 def save_config_with_session_state(config_type: str, config_data: Union[Dict, List]) -> None:
@@ -122,6 +169,10 @@ TRANSFORMATION_LIBRARY = {
     "Custom Python": "Enter Python expression using 'value'"
 }
 
+# Transformation names for the selectboxes, and each name's position among them
+TRANSFORMATION_NAMES = tuple(TRANSFORMATION_LIBRARY)
+TRANSFORMATION_INDEX = {name: i for i, name in enumerate(TRANSFORMATION_NAMES)}
+
 # Enhanced Python transformation templates
 PYTHON_TEMPLATES = {
     "Date Operations": {
@@ -203,122 +254,245 @@ pd.to_datetime(value, errors='coerce').strftime('%Y-%m-%d') if pd.notna(value) e
 - Keep expressions simple and readable
 """
 
-# Default templates with descriptions
-DEFAULT_TEMPLATES = {
-    "level": [
-        {"target_column1": "externalCode", "target_column2": "External Code", "description": "Unique identifier for the organizational unit"},
-        {"target_column1": "name.en_US", "target_column2": "Name (English US)", "description": "Name in US English"},
-        {"target_column1": "name.defaultValue", "target_column2": "Name (Default)", "description": "Default name value"},
-        {"target_column1": "effectiveStartDate", "target_column2": "Start Date", "description": "Effective start date"},
-        {"target_column1": "effectiveEndDate", "target_column2": "End Date", "description": "Effective end date"},
-        {"target_column1": "effectiveStatus", "target_column2": "Status", "description": "Current status (Active/Inactive)"},
-        {"target_column1": "Operator", "target_column2": "Operator", "description": "Operator information"},
-        {"target_column1": "Object abbr.", "target_column2": "Object Abbreviation", "description": "Object abbreviation"}
-    ],
-    "association": [
-        {"target_column1": "externalCode", "target_column2": "External Code", "description": "Unique identifier for the association"},
-        {"target_column1": "effectiveStartDate", "target_column2": "Start Date", "description": "Effective start date"},
-        {"target_column1": "effectiveEndDate", "target_column2": "End Date", "description": "Effective end date"},
-        {"target_column1": "cust_toLegalEntity.externalCode", "target_column2": "Parent Entity Code", "description": "Parent reference"},
-        {"target_column1": "relationshipType", "target_column2": "Relationship Type", "description": "Type of relationship"},
-        {"target_column1": "effectiveStatus", "target_column2": "Status", "description": "Current status"}
-    ]
-}
+# Default Level/Association templates ship as a JSON asset next to this module
+DEFAULT_TEMPLATES_PATH = Path(__file__).with_name("default_templates.json")
+
+@lru_cache(maxsize=1)
+def get_default_templates() -> Dict[str, List[Dict]]:
+    """Default templates keyed by lower-case template type; read once per process.
+    
+    The result is shared, so callers copy rows before mutating them.
+    """
+    return loads_json(DEFAULT_TEMPLATES_PATH.read_bytes())
+
+def file_version(path: Union[str, Path]) -> Optional[tuple]:
+    """(mtime_ns, size) of a file from a single stat, or None if it doesn't exist."""
+    try:
+        stat_result = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+@st.cache_data(show_spinner=False)
+def _read_csv_header(csv_path: Path, version: tuple) -> List[str]:
+    """Read only the header row of a CSV file; cached per (path, version)."""
+    with open(csv_path, "r", newline="", encoding="utf-8-sig") as f:
+        return next(csv.reader(f), [])
+
+@st.cache_data(show_spinner=False)
+def _read_sample_info(sample_path: Path, version: tuple) -> tuple:
+    """(row count, column names) of a saved sample; a Parquet sample is answered from its footer alone."""
+    if sample_path.suffix == LEGACY_SAMPLE_EXT:
+        with open(sample_path, "r", newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            names = next(reader, [])
+            return sum(1 for _ in reader), names
+    metadata = pq.read_metadata(sample_path)
+    return metadata.num_rows, metadata.schema.names
+
+def sample_path_for(source_file: str) -> Path:
+    """Where the saved sample for a source file type lives."""
+    return SOURCE_SAMPLES_PATH / f"{source_file}_sample{SAMPLE_EXT}"
 
-def safe_get_sample_value(col_data: pd.Series) -> str:
-    """Safely get sample value that won't cause Arrow serialization issues."""
-    if len(col_data) > 0:
-        sample = col_data.iloc[0]
-        if pd.isna(sample):
-            return "NULL"
-        return str(sample) if not isinstance(sample, (str, int, float, bool)) else str(sample)
-    return ""
+def saved_sample_path(source_file: str) -> Path:
+    """The saved sample to read for a source file type: Parquet, else a pre-Parquet CSV sample."""
+    sample_path = sample_path_for(source_file)
+    if sample_path.exists():
+        return sample_path
+    legacy_path = SOURCE_SAMPLES_PATH / f"{source_file}_sample{LEGACY_SAMPLE_EXT}"
+    return legacy_path if legacy_path.exists() else sample_path
+
+def saved_sample_sources(file_names: Iterable[str]) -> set:
+    """Source file types that have a saved sample (Parquet or legacy CSV) among the given names."""
+    suffixes = (f"_sample{SAMPLE_EXT}", f"_sample{LEGACY_SAMPLE_EXT}")
+    return {name.rsplit("_sample", 1)[0] for name in file_names if name.endswith(suffixes)}
 
 def get_source_columns(source_file: str) -> List[str]:
     """Dynamically get columns from source files with caching."""
     try:
-        sample_path = os.path.join(SOURCE_SAMPLES_DIR, f"{source_file}_sample.csv")
-        if os.path.exists(sample_path):
-            df = pd.read_csv(sample_path, nrows=1)
-            return df.columns.tolist()
+        sample_path = saved_sample_path(source_file)
+        version = file_version(sample_path)
+        if version is not None:
+            return list(_read_sample_info(sample_path, version)[1])
     except Exception as e:
         st.error(f"Error loading source columns: {str(e)}")
     
     # Fallback defaults for your data structure
-    if source_file == "HRP1000":
-        return ["Client", "Plan version", "Object type", "Object ID", "Planning status", "Start date", "End Date", "Name", "Object abbr."]
-    elif source_file == "HRP1001":
-        return ["Client", "Object type", "Source ID", "Plan version", "Relationship", "Planning status", "Start date", "End Date", "Target object ID"]
-    return []
+    return list(DEFAULT_SOURCE_COLUMNS.get(source_file, []))
+
+def list_csv_files(directory: Union[str, Path]) -> List[tuple]:
+    """Sorted (name, version) pairs for the CSV files in a directory, from one scandir pass."""
+    files = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.csv') and entry.is_file():
+                    stat_result = entry.stat()
+                    files.append((entry.name, (stat_result.st_mtime_ns, stat_result.st_size)))
+    except FileNotFoundError:
+        return []
+    return sorted(files)
+
+@st.cache_data(show_spinner=False)
+def _list_picklists(directory: str, version: tuple) -> Tuple[str, ...]:
+    """Sorted CSV names in a directory; cached per directory version (adds/removes bump its mtime)."""
+    return tuple(name for name, _ in list_csv_files(directory))
+
+def get_picklist_names() -> Tuple[str, ...]:
+    """Sorted names of the CSV picklists available in PICKLIST_DIR."""
+    version = file_version(PICKLIST_DIR)
+    if version is None:
+        return ()
+    return _list_picklists(PICKLIST_DIR, version)
+
+# Parsed picklists by file name: (version, frame). Only script threads read or
+# update it; frames are shared between sessions, so treat them as read-only.
+_PICKLIST_FRAMES: Dict[str, Tuple[tuple, pd.DataFrame]] = {}
+
+def _read_picklist(picklist_path: Path) -> pd.DataFrame:
+    """Parse a picklist CSV as text. No Streamlit calls, so it can run on a worker thread."""
+    return read_picklist_csv(picklist_path)
 
 def get_picklist_columns(picklist_file: str) -> List[str]:
     """Get columns from picklist files with error handling."""
     try:
-        df = pd.read_csv(f"{PICKLIST_DIR}/{picklist_file}", nrows=1)
-        return df.columns.tolist()
+        picklist_path = PICKLIST_PATH / picklist_file
+        return _read_csv_header(picklist_path, file_version(picklist_path))
     except Exception as e:
         st.error(f"Error loading picklist columns: {str(e)}")
         return []
 
-def save_config(config_type: str, config_data: Union[Dict, List]) -> None:
-    """Save configuration with atomic write pattern."""
-    temp_path = f"{CONFIG_DIR}/{config_type}_config.tmp"
-    final_path = f"{CONFIG_DIR}/{config_type}_config.json"
+def _fsync_dir(directory: Path) -> None:
+    """Flush a directory entry so a completed rename survives a crash (no-op where unsupported)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+def _file_bytes_equal(path: Path, payload: bytes) -> bool:
+    """Whether a file exists and holds exactly these bytes (size is checked before reading)."""
+    try:
+        if path.stat().st_size != len(payload):
+            return False
+        return path.read_bytes() == payload
+    except FileNotFoundError:
+        return False
+
+def save_config(config_type: str, config_data: Union[Dict, List], durable: bool = False) -> None:
+    """Save configuration atomically (temp file + os.replace).
+    
+    Admin edits are cheap to redo, so by default the write is not fsynced; pass
+    durable=True to flush the file and its directory entry before returning.
+    """
+    # Sessions run as threads and may save the same config at once, so each writer gets its own temp file
+    temp_path = CONFIG_PATH / f"{config_type}_config.{os.getpid()}.{threading.get_ident()}.tmp"
+    final_path = CONFIG_PATH / f"{config_type}_config.json"
     
     try:
-        with open(temp_path, "w") as f:
-            json.dump(config_data, f, indent=2)
-        if os.path.exists(temp_path):
-            if os.path.exists(final_path):
-                os.remove(final_path)
-            os.rename(temp_path, final_path)
+        payload = dumps_json(config_data, indent=PRETTY_CONFIG_JSON)
+        if _file_bytes_equal(final_path, payload):
+            # Nothing changed (e.g. resetting an untouched template); skip the write
+            st.success(f"{config_type} configuration saved successfully!")
+            return
+        with open(temp_path, "wb") as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, final_path)
+        if durable:
+            _fsync_dir(CONFIG_PATH)
+        _read_config_file.clear()
         st.success(f"{config_type} configuration saved successfully!")
     except Exception as e:
+        temp_path.unlink(missing_ok=True)
         st.error(f"Error saving config: {str(e)}")
 
+def _write_picklist(name: str, source: BinaryIO, durable: bool = False) -> None:
+    """Write a picklist from a binary stream atomically (temp file + os.replace).
+    
+    Same policy as save_config: not fsynced unless durable=True.
+    """
+    temp_path = PICKLIST_PATH / f".{name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") as out:
+            shutil.copyfileobj(source, out, length=1024 * 1024)
+            if durable:
+                out.flush()
+                os.fsync(out.fileno())
+        os.replace(temp_path, PICKLIST_PATH / name)
+        if durable:
+            _fsync_dir(PICKLIST_PATH)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+@st.cache_data(show_spinner=False)
+def _read_config_file(config_path: Path, version: tuple) -> Union[Dict, List]:
+    """Parse a config file; cached per (path, version) so reruns skip the disk read."""
+    return loads_json(config_path.read_bytes())
+
 def load_config(config_type: str) -> Optional[Union[Dict, List]]:
     """Load configuration with robust error handling."""
     try:
-        config_path = f"{CONFIG_DIR}/{config_type}_config.json"
-        if not os.path.exists(config_path):
+        config_path = CONFIG_PATH / f"{config_type}_config.json"
+        version = file_version(config_path)
+        if version is None:
             return None
             
-        with open(config_path, "r") as f:
-            data = json.load(f)
-            
-            if config_type in ["level", "association"]:
-                if isinstance(data, str):
-                    try:
-                        data = json.loads(data)
-                    except json.JSONDecodeError:
-                        return None
-                if not isinstance(data, list):
+        data = _read_config_file(config_path, version)
+        
+        if config_type in ["level", "association"]:
+            if isinstance(data, str):
+                if not _LEADING_BRACKET.match(data):
+                    return None
+                try:
+                    data = loads_json(data)
+                except json.JSONDecodeError:
                     return None
-            return data
+            if not isinstance(data, list):
+                return None
+        return data
     except Exception as e:
         st.error(f"Error loading config: {str(e)}")
         return None
 
+def list_dir_files(directory: str) -> set:
+    """Names of the files in a directory from a single scandir pass (empty if it doesn't exist)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
 def show_configuration_status():
     """Show current configuration status at the top"""
     st.subheader("Current Configuration Status")
     
+    # One directory read per folder instead of an exists() probe per file
+    config_files_present = list_dir_files(CONFIG_DIR)
+    picklist_files = list_dir_files(PICKLIST_DIR)
+    sample_files = list_dir_files(SOURCE_SAMPLES_DIR)
+    
     # Check configuration files
     config_files = [
-        ("Level Template", "configs/level_config.json"),
-        ("Association Template", "configs/association_config.json"), 
-        ("Column Mappings", "configs/column_mappings_config.json")
+        ("Level Template", "level_config.json"),
+        ("Association Template", "association_config.json"), 
+        ("Column Mappings", "column_mappings_config.json")
     ]
     
     cols = st.columns(3)
     for i, (name, file) in enumerate(config_files):
         with cols[i]:
-            if os.path.exists(file):
+            if file in config_files_present:
                 st.success(f"Available: {name}")
                 try:
-                    with open(file, 'r') as f:
-                        data = json.load(f)
-                        st.caption(f"Items: {len(data)}")
+                    config_path = CONFIG_PATH / file
+                    data = _read_config_file(config_path, file_version(config_path))
+                    st.caption(f"Items: {len(data)}")
                 except:
                     st.caption("Status: Available")
             else:
@@ -329,18 +503,12 @@ def show_configuration_status():
     cols = st.columns(4)
     
     with cols[0]:
-        if os.path.exists("picklists"):
-            picklist_count = len([f for f in os.listdir("picklists") if f.endswith('.csv')])
-            st.metric("Picklists", picklist_count)
-        else:
-            st.metric("Picklists", 0)
+        picklist_count = sum(f.endswith('.csv') for f in picklist_files)
+        st.metric("Picklists", picklist_count)
     
     with cols[1]:
-        if os.path.exists("source_samples"):
-            sample_count = len([f for f in os.listdir("source_samples") if f.endswith('.csv')])
-            st.metric("Sample Files", sample_count)
-        else:
-            st.metric("Sample Files", 0)
+        sample_count = len(saved_sample_sources(sample_files))
+        st.metric("Sample Files", sample_count)
     
     with cols[2]:
         mappings = load_config("column_mappings")
@@ -356,82 +524,168 @@ def show_configuration_status():
         else:
             st.metric("Level Fields", 0)
 
-def validate_sample_columns(source_file: str, sample_df: pd.DataFrame) -> tuple:
-    """Validate sample files have required columns."""
+def validate_sample_columns(source_file: str, columns: Iterable[str]) -> tuple:
+    """Validate that a sample's column names include the required columns."""
     required_columns = {
         "HRP1000": ["Object ID", "Name"],
         "HRP1001": ["Source ID", "Target object ID"]
     }
-    missing_cols = set(required_columns.get(source_file, [])) - set(sample_df.columns)
+    missing_cols = set(required_columns.get(source_file, [])).difference(columns)
     if missing_cols:
         return False, f"Missing required columns: {', '.join(missing_cols)}"
     return True, "All required columns present"
 
+# Samples are SAP extracts of codes, IDs and dd.mm.yyyy dates: read every cell as
+# text, as-is, and skip type inference and NA detection entirely
+SAMPLE_READ_OPTIONS = {"nrows": MAX_SAMPLE_ROWS, "dtype": str, "na_filter": False}
+
+def read_csv_sample(uploaded_file) -> pd.DataFrame:
+    """Read up to MAX_SAMPLE_ROWS from an uploaded CSV, detecting the encoding if it is not UTF-8."""
+    try:
+        return pd.read_csv(uploaded_file, engine="c", low_memory=False, **SAMPLE_READ_OPTIONS)
+    except UnicodeDecodeError:
+        raw = uploaded_file.getvalue()
+        encoding = chardet.detect(raw[:65536])['encoding'] or "latin-1"
+        return pd.read_csv(io.BytesIO(raw), engine="c", low_memory=False, encoding=encoding, **SAMPLE_READ_OPTIONS)
+
+def read_excel_sample(uploaded_file) -> pd.DataFrame:
+    """Read up to MAX_SAMPLE_ROWS from the first sheet of an uploaded workbook."""
+    return pd.read_excel(uploaded_file, sheet_name=0, engine=EXCEL_ENGINE, **SAMPLE_READ_OPTIONS)
+
+# .xlsx workbooks are zip archives; anything else is read as CSV whatever its name
+XLSX_MAGIC = b"PK\x03\x04"
+
+def get_sample_reader(data: bytes):
+    """Reader for an uploaded sample, chosen by its leading bytes rather than its extension."""
+    return read_excel_sample if data[:4] == XLSX_MAGIC else read_csv_sample
+
+@st.cache_data(show_spinner=False)
+def _parse_sample_upload(data: bytes) -> pd.DataFrame:
+    """Parse the first MAX_SAMPLE_ROWS of an upload; cached so reruns don't re-parse it."""
+    return get_sample_reader(data)(io.BytesIO(data))
+
+def save_sample(df: pd.DataFrame, sample_path: Path) -> None:
+    """Write a parsed sample to Parquet via a temp file, so readers never see a partial file."""
+    # One temp file per writer, as in save_config; sessions may save the same sample at once
+    temp_path = sample_path.with_name(f"{sample_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        df.to_parquet(temp_path, engine="pyarrow", compression=SAMPLE_COMPRESSION, index=False)
+        os.replace(temp_path, sample_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
 def process_uploaded_file(uploaded_file, source_file_type: str) -> None:
     """Process and validate uploaded sample files."""
     try:
-        if uploaded_file.name.endswith('.xlsx'):
-            df = pd.read_excel(uploaded_file, nrows=MAX_SAMPLE_ROWS)
-        else:
-            df = pd.read_csv(uploaded_file, nrows=MAX_SAMPLE_ROWS)
+        df = _parse_sample_upload(uploaded_file.getvalue())
         
-        is_valid, message = validate_sample_columns(source_file_type, df)
+        is_valid, message = validate_sample_columns(source_file_type, df.columns)
         if not is_valid:
             st.error(message)
             return
 
-        sample_path = os.path.join(SOURCE_SAMPLES_DIR, f"{source_file_type}_sample.csv")
-        df.to_csv(sample_path, index=False)
+        # The uploader keeps its file across reruns; only write the sample once per upload
+        saved_key = f"{source_file_type}_saved_upload"
+        if st.session_state.get(saved_key) != uploaded_file.file_id:
+            save_sample(df, sample_path_for(source_file_type))
+            st.session_state[saved_key] = uploaded_file.file_id
         st.success(f"Sample {source_file_type} file saved successfully!")
         
         with st.expander("File Preview", expanded=True):
-            st.dataframe(df.head().astype(str))
+            # Samples are read as text, so only stray object columns need a cast for Arrow
+            preview = df.head()
+            object_cols = preview.select_dtypes(include=["object"]).columns
+            if len(object_cols):
+                preview = preview.astype({col: "string" for col in object_cols})
+            st.dataframe(preview)
         
         st.subheader("Column Information")
-        col_info = []
-        for col in df.columns:
-            col_info.append({
-                "Column": col,
-                "Type": str(df[col].dtype),
-                "Unique Values": df[col].nunique(),
-                "Sample Value": safe_get_sample_value(df[col])
-            })
-        st.dataframe(pd.DataFrame(col_info))
+        # Sample values are stringified so mixed types don't trip Arrow serialization;
+        # astype(object) keeps each value's own type instead of upcasting the row
+        if len(df):
+            first_row = df.head(1).astype(object).iloc[0]
+            sample_values = first_row.astype(str).where(first_row.notna() & first_row.ne(""), "NULL").values
+        else:
+            sample_values = [""] * len(df.columns)
+        col_info = pd.DataFrame({
+            "Column": df.columns,
+            "Type": df.dtypes.astype(str).values,
+            "Unique Values": df.nunique().values,
+            "Sample Value": sample_values
+        })
+        st.dataframe(col_info)
         
     except Exception as e:
         st.error(f"Error processing file: {str(e)}")
 
+@lru_cache(maxsize=32)
+def _text_to_template_rows(text_input: str) -> tuple:
+    """Parse text into (column, display name, description) rows; memoized on the text."""
+    rows = []
+    # csv.reader honours quoting, so descriptions may contain commas
+    for parts in csv.reader(io.StringIO(text_input)):
+        # Empty fields are skipped, so a line like "a,,c" still yields a row
+        parts = [part.strip() for part in parts if part.strip()]
+        if len(parts) >= 2:
+            rows.append((parts[0], parts[1], parts[2] if len(parts) > 2 else ""))
+    return tuple(rows)
+
 def convert_text_to_template(text_input: str) -> List[Dict]:
     """Convert text input to template format."""
-    lines = [line.strip() for line in text_input.split('\n') if line.strip()]
-    template = []
-    for line in lines:
-        parts = [part.strip() for part in line.split(',') if part.strip()]
-        if len(parts) >= 2:
-            template.append({
-                "target_column1": parts[0],
-                "target_column2": parts[1],
-                "description": parts[2] if len(parts) > 2 else ""
-            })
-    return template
+    # Fresh dicts on every call; the editor mutates the rows it is given
+    return [
+        {"target_column1": col1, "target_column2": col2, "description": description}
+        for col1, col2, description in _text_to_template_rows(text_input)
+    ]
+
+@lru_cache(maxsize=32)
+def _template_rows_to_text(rows: tuple) -> str:
+    """Write (column, display name, description) rows as CSV; memoized on the row contents."""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().rstrip("\n")
 
 def convert_template_to_text(template: List[Dict]) -> str:
     """Convert template to text input format."""
-    return '\n'.join([
-        f"{item['target_column1']},{item['target_column2']},{item.get('description', '')}"
+    return _template_rows_to_text(tuple(
+        (item['target_column1'], item['target_column2'], item.get('description', ''))
         for item in template
-    ])
+    ))
+
+def _set_template_rows(state_key: str, rows: List[Dict]) -> None:
+    """Store a template's rows with their text form, so the text view is only rebuilt on edits."""
+    st.session_state[state_key] = rows
+    st.session_state[f"{state_key}_text"] = convert_template_to_text(rows)
+
+def _reset_template_editor(state_key: str, rows: List[Dict]) -> None:
+    """Replace a template's rows and start its table editor over from them."""
+    _set_template_rows(state_key, rows)
+    st.session_state[f"{state_key}_editor_base"] = [dict(row) for row in rows]
+    version_key = f"{state_key}_editor_version"
+    st.session_state[version_key] = st.session_state.get(version_key, 0) + 1
+
+def get_target_options(template_type: str) -> List[str]:
+    """'System Column | Display Name' choices for mappings that target a template.
+    
+    Not cached itself: load_config can report errors with st.error, which must not be
+    replayed from a cache, and the file parse underneath is already cached per version.
+    """
+    template = load_config(template_type) or get_default_templates()[template_type]
+    return [f"{row['target_column1']} | {row['target_column2']}" for row in template]
 
 def render_template_editor(template_type: str) -> None:
     """Render the template editor with reordering and delete functionality."""
     st.subheader(f"{template_type} Template Configuration")
     
-    # Load template or use defaults
-    current_template = load_config(template_type.lower()) or DEFAULT_TEMPLATES[template_type.lower()]
+    tt = template_type.lower()
+    state_key = f"{template_type}_template"
     
-    # Store the current template in session state if not already present
-    if f"{template_type}_template" not in st.session_state:
-        st.session_state[f"{template_type}_template"] = current_template.copy()
+    # Seed session state from the saved template (or defaults) on first render only;
+    # rows are copied because the editor mutates them in place
+    if state_key not in st.session_state:
+        current_template = load_config(tt) or get_default_templates()[tt]
+        _set_template_rows(state_key, [dict(row) for row in current_template])
     
     # Edit mode selection
     edit_mode = st.radio(
@@ -443,88 +697,69 @@ def render_template_editor(template_type: str) -> None:
     
     # Reset button
     if st.button(f"Reset {template_type} Template to Default"):
-        st.session_state[f"{template_type}_template"] = DEFAULT_TEMPLATES[template_type.lower()].copy()
-        save_config_with_session_state(template_type.lower(), st.session_state[f"{template_type}_template"])
+        _reset_template_editor(state_key, [dict(row) for row in get_default_templates()[tt]])
+        save_config_with_session_state(tt, st.session_state[state_key])
         st.rerun()
     
     if edit_mode == "Table Editor":
         st.markdown("""
         **Instructions:**
-        - Use up/down arrows to reorder rows
-        - Use delete button to remove rows
-        - Add new rows below
-        - Edit cells directly
+        - Edit cells directly in the table
+        - Add rows with the + at the bottom, delete by selecting rows and pressing Delete
+        - Use the row selector and up/down arrows below to reorder rows
         - Save when done
         """)
         
-        # Display each row with controls
-        for i, row in enumerate(st.session_state[f"{template_type}_template"]):
-            cols = st.columns([0.3, 2.5, 2.5, 2.5, 0.5, 0.5, 0.5])
-            with cols[0]:
-                st.caption(f"Row {i+1}")
-            with cols[1]:
-                row['target_column1'] = st.text_input(
-                    "System Column Name",
-                    value=row['target_column1'],
-                    key=f"col1_{i}",
-                    label_visibility="collapsed"
-                )
-            with cols[2]:
-                row['target_column2'] = st.text_input(
-                    "Display Name",
-                    value=row['target_column2'],
-                    key=f"col2_{i}",
-                    label_visibility="collapsed"
-                )
-            with cols[3]:
-                row['description'] = st.text_input(
-                    "Description",
-                    value=row.get('description', ''),
-                    key=f"desc_{i}",
-                    label_visibility="collapsed"
+        # The editor diffs its edits against the rows it was created from, so those rows
+        # stay fixed until _reset_template_editor hands it new ones under a new key
+        base_key = f"{state_key}_editor_base"
+        if base_key not in st.session_state:
+            _reset_template_editor(state_key, st.session_state[state_key])
+        edited = st.data_editor(
+            pd.DataFrame(st.session_state[base_key], columns=list(TEMPLATE_COLUMNS)),
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "target_column1": "System Column Name",
+                "target_column2": "Display Name",
+                "description": "Description"
+            },
+            key=f"{state_key}_editor_{st.session_state[f'{state_key}_editor_version']}"
+        )
+        rows = edited.fillna("").to_dict("records")
+        if rows != st.session_state[state_key]:
+            _set_template_rows(state_key, rows)
+        
+        # Reorder rows
+        if len(rows) > 1:
+            move_cols = st.columns([4, 1, 1])
+            with move_cols[0]:
+                move_index = st.selectbox(
+                    "Move row",
+                    list(range(len(rows))),
+                    format_func=lambda i: f"Row {i+1}: {rows[i]['target_column1']}",
+                    key=f"{state_key}_move_row"
                 )
-            with cols[4]:
-                if st.button("↑", key=f"up_{i}", disabled=(i == 0)):
-                    st.session_state[f"{template_type}_template"][i], st.session_state[f"{template_type}_template"][i-1] = \
-                        st.session_state[f"{template_type}_template"][i-1], st.session_state[f"{template_type}_template"][i]
-                    st.rerun()
-            with cols[5]:
-                if st.button("↓", key=f"down_{i}", disabled=(i == len(st.session_state[f"{template_type}_template"])-1)):
-                    st.session_state[f"{template_type}_template"][i], st.session_state[f"{template_type}_template"][i+1] = \
-                        st.session_state[f"{template_type}_template"][i+1], st.session_state[f"{template_type}_template"][i]
+            with move_cols[1]:
+                if st.button("↑", key=f"{state_key}_up", disabled=(move_index == 0)):
+                    rows[move_index - 1], rows[move_index] = rows[move_index], rows[move_index - 1]
+                    _reset_template_editor(state_key, rows)
                     st.rerun()
-            with cols[6]:
-                if st.button("Delete", key=f"del_{i}"):
-                    del st.session_state[f"{template_type}_template"][i]
-                    st.success("Row deleted!")
+            with move_cols[2]:
+                if st.button("↓", key=f"{state_key}_down", disabled=(move_index == len(rows) - 1)):
+                    rows[move_index + 1], rows[move_index] = rows[move_index], rows[move_index + 1]
+                    _reset_template_editor(state_key, rows)
                     st.rerun()
-        
-        # Add new row
-        st.subheader("Add New Row")
-        new_cols = st.columns(3)
-        with new_cols[0]:
-            new_col1 = st.text_input("System Column Name", key="new_col1")
-        with new_cols[1]:
-            new_col2 = st.text_input("Display Name", key="new_col2")
-        with new_cols[2]:
-            new_desc = st.text_input("Description", key="new_desc")
-        
-        if st.button("Add Row"):
-            if new_col1 and new_col2:
-                st.session_state[f"{template_type}_template"].append({
-                    "target_column1": new_col1,
-                    "target_column2": new_col2,
-                    "description": new_desc
-                })
-                st.success("Row added!")
-                st.rerun()
-            else:
-                st.error("Please fill System Column Name and Display Name")
     
     else:  # Text Input mode
+        # Hand the table editor the current rows for when the user switches back
+        if st.session_state.get(f"{state_key}_editor_base") != st.session_state[state_key]:
+            _reset_template_editor(state_key, st.session_state[state_key])
+        
         text_content = st.text_area(
             "Edit template as text (CSV format: System Column,Display Name,Description)",
-            value=convert_template_to_text(st.session_state[f"{template_type}_template"]),
+            value=st.session_state[f"{state_key}_text"],
             height=400,
             key=f"{template_type}_text_input"
         )
@@ -532,7 +767,7 @@ def render_template_editor(template_type: str) -> None:
         if st.button("Apply Text Changes"):
             try:
                 new_template = convert_text_to_template(text_content)
-                st.session_state[f"{template_type}_template"] = new_template
+                _reset_template_editor(state_key, new_template)
                 st.success("Template updated from text input!")
                 st.rerun()
             except Exception as e:
@@ -541,7 +776,7 @@ def render_template_editor(template_type: str) -> None:
     # Save template
     if st.button(f"Save {template_type} Template", type="primary"):
         validation_errors = []
-        for i, row in enumerate(st.session_state[f"{template_type}_template"]):
+        for i, row in enumerate(st.session_state[state_key]):
             if not row.get('target_column1'):
                 validation_errors.append(f"Row {i+1}: Missing System Column Name")
             if not row.get('target_column2'):
@@ -550,16 +785,16 @@ def render_template_editor(template_type: str) -> None:
         if validation_errors:
             st.error("Validation errors:\n" + "\n".join(validation_errors))
         else:
-            save_config_with_session_state(template_type.lower(), st.session_state[f"{template_type}_template"])
+            save_config_with_session_state(tt, st.session_state[state_key])
             
             st.subheader("Saved Template Preview")
             cols = st.columns(2)
             with cols[0]:
                 st.subheader("Table View")
-                st.dataframe(pd.DataFrame(st.session_state[f"{template_type}_template"]))
+                st.dataframe(pd.DataFrame(st.session_state[state_key]))
             with cols[1]:
                 st.subheader("Text View")
-                st.code(convert_template_to_text(st.session_state[f"{template_type}_template"]))
+                st.code(st.session_state[f"{state_key}_text"])
 
 def manage_picklists() -> None:
     """Render the picklist management interface."""
@@ -576,7 +811,17 @@ def manage_picklists() -> None:
     if new_picklists:
         for file in new_picklists:
             try:
-                pd.read_csv(file).to_csv(f"{PICKLIST_DIR}/{file.name}", index=False)
+                # Uploads stay in the widget across reruns; only write each one once
+                saved_key = f"picklist_saved_{file.name}"
+                if st.session_state.get(saved_key) != file.file_id:
+                    # Header sanity check only; the bytes are stored as uploaded
+                    head = file.read(4096).decode("utf-8-sig", errors="replace")
+                    if not next(csv.reader(io.StringIO(head)), []):
+                        st.error(f"{file.name} has no header row")
+                        continue
+                    file.seek(0)
+                    _write_picklist(file.name, file)
+                    st.session_state[saved_key] = file.file_id
                 st.success(f"Saved: {file.name}")
             except Exception as e:
                 st.error(f"Error processing {file.name}: {str(e)}")
@@ -599,43 +844,69 @@ def manage_picklists() -> None:
         try:
             if not pl_name.endswith(".csv"):
                 pl_name += ".csv"
-            from io import StringIO
-            pd.read_csv(StringIO(pl_content)).to_csv(f"{PICKLIST_DIR}/{pl_name}", index=False)
+            # Check the shape with csv.reader, then store the text as typed
+            rows = [row for row in csv.reader(io.StringIO(pl_content)) if row]
+            if not rows:
+                raise ValueError("no header row")
+            too_long = next((i for i, row in enumerate(rows[1:], start=2) if len(row) > len(rows[0])), None)
+            if too_long is not None:
+                raise ValueError(f"row {too_long} has more fields than the header")
+            text = pl_content if pl_content.endswith("\n") else pl_content + "\n"
+            _write_picklist(pl_name, io.BytesIO(text.encode("utf-8")))
             st.success(f"Picklist {pl_name} created!")
         except Exception as e:
             st.error(f"Error creating picklist: {str(e)}")
     
     # Display existing picklists
     st.subheader("Available Picklists")
-    if os.path.exists(PICKLIST_DIR):
-        picklists = sorted([f for f in os.listdir(PICKLIST_DIR) if f.endswith('.csv')])
-        if not picklists:
-            st.info("No picklists available yet")
-        
-        for pl in picklists:
-            st.subheader(f"Picklist: {pl}")
-            cols = st.columns([4, 1])
-            with cols[0]:
-                try:
-                    df = pd.read_csv(f"{PICKLIST_DIR}/{pl}")
+    # Versions come from the listing itself; listing is not cached because
+    # in-place rewrites don't change the directory's version
+    picklists = list_csv_files(PICKLIST_PATH)
+    if not picklists:
+        st.info("No picklists available yet")
+    
+    # Forget deleted picklists, then parse only new or changed ones, concurrently;
+    # warm reruns never start the pool
+    for stale in _PICKLIST_FRAMES.keys() - {pl for pl, _ in picklists}:
+        _PICKLIST_FRAMES.pop(stale, None)
+    misses = {pl: pl_version for pl, pl_version in picklists
+              if _PICKLIST_FRAMES.get(pl, (None,))[0] != pl_version}
+    loads = {}
+    if misses:
+        with ThreadPoolExecutor(max_workers=min(PICKLIST_LOAD_WORKERS, len(misses))) as pool:
+            loads = {pl: pool.submit(_read_picklist, PICKLIST_PATH / pl) for pl in misses}
+    
+    for pl, _ in picklists:
+        st.subheader(f"Picklist: {pl}")
+        cols = st.columns([4, 1])
+        with cols[0]:
+            try:
+                if pl in loads:
+                    _PICKLIST_FRAMES[pl] = (misses[pl], loads[pl].result())
+                df = _PICKLIST_FRAMES[pl][1]
+                # Only ship the full table to the browser when asked for
+                if len(df) > PICKLIST_PREVIEW_ROWS and not st.checkbox(f"Show all {len(df)} rows", key=f"show_all_{pl}"):
+                    st.dataframe(df.head(PICKLIST_PREVIEW_ROWS), use_container_width=True)
+                else:
                     st.dataframe(df, use_container_width=True)
-                    st.caption(f"Rows: {len(df)}, Columns: {len(df.columns)}")
+                st.caption(f"Rows: {len(df)}, Columns: {len(df.columns)}")
+            except Exception as e:
+                st.error(f"Error loading: {str(e)}")
+        with cols[1]:
+            if st.button(f"Delete {pl}", key=f"del_{pl}"):
+                try:
+                    os.remove(PICKLIST_PATH / pl)
+                    st.success(f"Deleted {pl}")
+                    st.rerun()
                 except Exception as e:
-                    st.error(f"Error loading: {str(e)}")
-            with cols[1]:
-                if st.button(f"Delete {pl}", key=f"del_{pl}"):
-                    try:
-                        os.remove(f"{PICKLIST_DIR}/{pl}")
-                        st.success(f"Deleted {pl}")
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Error deleting: {str(e)}")
+                    st.error(f"Error deleting: {str(e)}")
 
 def render_column_mapping_interface() -> None:
     """Render the column mapping configuration interface."""
     st.subheader("Column Mapping Configuration")
     
     current_mappings = load_config_with_session_state("column_mappings") or get_default_mappings()
+    picklist_names = get_picklist_names()
     
     # Download current mappings
     if current_mappings:
@@ -654,17 +925,15 @@ def render_column_mapping_interface() -> None:
     # Basic mapping configuration
     cols = st.columns([2, 2, 1])
     with cols[0]:
-        applies_to = st.selectbox("Applies To", ["Level", "Association", "Both"])
+        applies_to = st.selectbox("Applies To", APPLIES_TO_OPTIONS)
         
         # Get target options from templates
         target_options = []
         if applies_to in ["Level", "Both"]:
-            level_template = load_config("level") or DEFAULT_TEMPLATES["level"]
-            target_options.extend([f"{col['target_column1']} | {col['target_column2']}" for col in level_template])
+            target_options.extend(get_target_options("level"))
         
         if applies_to in ["Association", "Both"]:
-            assoc_template = load_config("association") or DEFAULT_TEMPLATES["association"]
-            target_options.extend([f"{col['target_column1']} | {col['target_column2']}" for col in assoc_template])
+            target_options.extend(get_target_options("association"))
         
         if target_options:
             target_selection = st.selectbox("Target Column", sorted(set(target_options)))
@@ -677,22 +946,23 @@ def render_column_mapping_interface() -> None:
             target_col1, target_col2 = "", ""
     
     with cols[1]:
-        source_file = st.selectbox("Source File", ["HRP1000", "HRP1001"])
+        source_file = st.selectbox("Source File", SOURCE_FILE_TYPES)
         source_columns = get_source_columns(source_file)
-        source_col = st.selectbox("Source Column", [""] + source_columns, 
+        source_col_options = [""] + source_columns
+        source_col = st.selectbox("Source Column", source_col_options, 
                                 help="Leave empty if using only default value")
     
     with cols[2]:
         default_val = st.text_input("Default Value", 
                                   help="Value to use if source is empty")
-        picklist_options = [""] + sorted([f for f in os.listdir(PICKLIST_DIR) if f.endswith('.csv')]) if os.path.exists(PICKLIST_DIR) else [""]
+        picklist_options = ("",) + picklist_names
         picklist_file = st.selectbox("Picklist File", picklist_options)
     
     # Transformation rules
     st.markdown("#### Transformation Rules")
     trans_col1, trans_col2 = st.columns(2)
     with trans_col1:
-        trans_type = st.selectbox("Transformation Type", list(TRANSFORMATION_LIBRARY.keys()))
+        trans_type = st.selectbox("Transformation Type", TRANSFORMATION_NAMES)
     
     with trans_col2:
         picklist_col = ""
@@ -700,7 +970,7 @@ def render_column_mapping_interface() -> None:
         custom_code = ""
         
         if trans_type == "Concatenate":
-            second_col = st.selectbox("Second Column", [""] + source_columns)
+            second_col = st.selectbox("Second Column", source_col_options)
         elif trans_type == "Lookup Value":
             if picklist_file:
                 picklist_col = st.selectbox("Picklist Column", [""] + get_picklist_columns(picklist_file))
@@ -824,119 +1094,124 @@ str(value).strip() if pd.notna(value) else ''
     if not current_mappings:
         st.info("No mappings configured yet")
     else:
-        for i, mapping in enumerate(current_mappings):
-            st.markdown(f"#### Mapping {i+1}: {mapping.get('target_column1', 'Unknown')}")
-            
-            cols = st.columns([3, 3, 2])
-            with cols[0]:
-                st.info(f"**Target:** {mapping.get('target_column1', '')}")
-                st.info(f"**Display:** {mapping.get('target_column2', '')}")
-            with cols[1]:
-                st.info(f"**Source File:** {mapping.get('source_file', '')}")
-                st.info(f"**Source Column:** {mapping.get('source_column', 'None')}")
-            with cols[2]:
-                st.info(f"**Transformation:** {mapping.get('transformation', 'None')}")
-                st.info(f"**Applies To:** {mapping.get('applies_to', '')}")
+        # One table for all mappings instead of a card of widgets per mapping
+        st.dataframe(pd.DataFrame([
+            {
+                "Mapping": i + 1,
+                "Target": mapping.get('target_column1', ''),
+                "Display": mapping.get('target_column2', ''),
+                "Source File": mapping.get('source_file', ''),
+                "Source Column": mapping.get('source_column', 'None'),
+                "Transformation": mapping.get('transformation', 'None'),
+                "Applies To": mapping.get('applies_to', '')
+            }
+            for i, mapping in enumerate(current_mappings)
+        ]), hide_index=True, use_container_width=True)
+        
+        i = st.selectbox(
+            "Select Mapping",
+            list(range(len(current_mappings))),
+            format_func=lambda idx: f"Mapping {idx+1}: {current_mappings[idx].get('target_column1', 'Unknown')}",
+            key="selected_mapping"
+        )
+        mapping = current_mappings[i]
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button(f"Edit Mapping {i+1}", key=f"edit_{i}"):
+                st.session_state[f'editing_mapping_{i}'] = True
+                st.rerun()
+        with col2:
+            if st.button(f"Delete Mapping {i+1}", key=f"delete_{i}"):
+                del current_mappings[i]
+                save_config_with_session_state("column_mappings", current_mappings)
+                st.success(f"Mapping {i+1} deleted!")
+                st.rerun()
+        
+        # Show edit form if this mapping is being edited
+        if st.session_state.get(f'editing_mapping_{i}', False):
+            st.subheader(f"Edit Mapping {i+1}")
             
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button(f"Edit Mapping {i+1}", key=f"edit_{i}"):
-                    st.session_state[f'editing_mapping_{i}'] = True
-                    st.rerun()
-            with col2:
-                if st.button(f"Delete Mapping {i+1}", key=f"delete_{i}"):
-                    del current_mappings[i]
-                    save_config_with_session_state("column_mappings", current_mappings)
-                    st.success(f"Mapping {i+1} deleted!")
-                    st.rerun()
+            edit_col1, edit_col2 = st.columns(2)
+            with edit_col1:
+                new_applies_to = st.selectbox("Applies To", APPLIES_TO_OPTIONS, 
+                                            index=APPLIES_TO_OPTIONS.index(mapping.get('applies_to', 'Level')),
+                                            key=f"edit_applies_{i}")
+                new_source_file = st.selectbox("Source File", SOURCE_FILE_TYPES,
+                                             index=SOURCE_FILE_TYPES.index(mapping.get('source_file', 'HRP1000')),
+                                             key=f"edit_source_file_{i}")
+                source_columns = get_source_columns(new_source_file)
+                current_source_col = mapping.get('source_column', '')
+                source_col_options = [""] + source_columns
+                source_col_index = source_col_options.index(current_source_col) if current_source_col in source_col_options else 0
+                new_source_col = st.selectbox("Source Column", source_col_options,
+                                            index=source_col_index, key=f"edit_source_col_{i}")
             
-            # Show edit form if this mapping is being edited
-            if st.session_state.get(f'editing_mapping_{i}', False):
-                st.subheader(f"Edit Mapping {i+1}")
+            with edit_col2:
+                new_transformation = st.selectbox("Transformation", TRANSFORMATION_NAMES,
+                                                index=TRANSFORMATION_INDEX.get(mapping.get('transformation', 'None'), 0),
+                                                key=f"edit_trans_{i}")
+                new_default_val = st.text_input("Default Value", value=mapping.get('default_value', ''),
+                                              key=f"edit_default_{i}")
                 
-                edit_col1, edit_col2 = st.columns(2)
-                with edit_col1:
-                    new_applies_to = st.selectbox("Applies To", ["Level", "Association", "Both"], 
-                                                index=["Level", "Association", "Both"].index(mapping.get('applies_to', 'Level')),
-                                                key=f"edit_applies_{i}")
-                    new_source_file = st.selectbox("Source File", ["HRP1000", "HRP1001"],
-                                                 index=["HRP1000", "HRP1001"].index(mapping.get('source_file', 'HRP1000')),
-                                                 key=f"edit_source_file_{i}")
-                    source_columns = get_source_columns(new_source_file)
-                    current_source_col = mapping.get('source_column', '')
-                    source_col_options = [""] + source_columns
-                    source_col_index = source_col_options.index(current_source_col) if current_source_col in source_col_options else 0
-                    new_source_col = st.selectbox("Source Column", source_col_options,
-                                                index=source_col_index, key=f"edit_source_col_{i}")
-                
-                with edit_col2:
-                    new_transformation = st.selectbox("Transformation", list(TRANSFORMATION_LIBRARY.keys()),
-                                                    index=list(TRANSFORMATION_LIBRARY.keys()).index(mapping.get('transformation', 'None')),
-                                                    key=f"edit_trans_{i}")
-                    new_default_val = st.text_input("Default Value", value=mapping.get('default_value', ''),
-                                                  key=f"edit_default_{i}")
+                picklist_options = ("",) + picklist_names
+                current_picklist = mapping.get('picklist_source', '')
+                picklist_index = picklist_options.index(current_picklist) if current_picklist in picklist_options else 0
+                new_picklist_file = st.selectbox("Picklist File", picklist_options,
+                                               index=picklist_index, key=f"edit_picklist_{i}")
+            
+            # Handle transformation-specific fields
+            new_picklist_col = ""
+            new_second_col = ""
+            new_custom_code = ""
+            
+            if new_transformation == "Concatenate":
+                current_second_col = mapping.get('secondary_column', '')
+                second_col_index = source_col_options.index(current_second_col) if current_second_col in source_col_options else 0
+                new_second_col = st.selectbox("Second Column", source_col_options,
+                                            index=second_col_index, key=f"edit_second_{i}")
+            elif new_transformation == "Lookup Value" and new_picklist_file:
+                picklist_cols = get_picklist_columns(new_picklist_file)
+                current_picklist_col = mapping.get('picklist_column', '')
+                picklist_col_options = [""] + picklist_cols
+                picklist_col_index = picklist_col_options.index(current_picklist_col) if current_picklist_col in picklist_col_options else 0
+                new_picklist_col = st.selectbox("Picklist Column", picklist_col_options,
+                                              index=picklist_col_index, key=f"edit_picklist_col_{i}")
+            elif new_transformation == "Custom Python":
+                new_custom_code = st.text_area("Python Expression", 
+                                              value=mapping.get('transformation_code', 'value'),
+                                              key=f"edit_custom_{i}")
+            
+            # Save/Cancel buttons
+            save_col, cancel_col = st.columns(2)
+            with save_col:
+                if st.button(f"Save Changes {i+1}", key=f"save_{i}"):
+                    # Update the mapping
+                    current_mappings[i].update({
+                        'applies_to': new_applies_to,
+                        'source_file': new_source_file,
+                        'source_column': new_source_col,
+                        'transformation': new_transformation,
+                        'default_value': new_default_val,
+                        'picklist_source': new_picklist_file,
+                        'picklist_column': new_picklist_col,
+                        'transformation_code': TRANSFORMATION_LIBRARY.get(new_transformation, "value")
+                    })
                     
-                    picklist_options = [""] + sorted([f for f in os.listdir(PICKLIST_DIR) if f.endswith('.csv')]) if os.path.exists(PICKLIST_DIR) else [""]
-                    current_picklist = mapping.get('picklist_source', '')
-                    picklist_index = picklist_options.index(current_picklist) if current_picklist in picklist_options else 0
-                    new_picklist_file = st.selectbox("Picklist File", picklist_options,
-                                                   index=picklist_index, key=f"edit_picklist_{i}")
-                
-                # Handle transformation-specific fields
-                new_picklist_col = ""
-                new_second_col = ""
-                new_custom_code = ""
-                
-                if new_transformation == "Concatenate":
-                    current_second_col = mapping.get('secondary_column', '')
-                    second_col_options = [""] + source_columns
-                    second_col_index = second_col_options.index(current_second_col) if current_second_col in second_col_options else 0
-                    new_second_col = st.selectbox("Second Column", second_col_options,
-                                                index=second_col_index, key=f"edit_second_{i}")
-                elif new_transformation == "Lookup Value" and new_picklist_file:
-                    picklist_cols = get_picklist_columns(new_picklist_file)
-                    current_picklist_col = mapping.get('picklist_column', '')
-                    picklist_col_options = [""] + picklist_cols
-                    picklist_col_index = picklist_col_options.index(current_picklist_col) if current_picklist_col in picklist_col_options else 0
-                    new_picklist_col = st.selectbox("Picklist Column", picklist_col_options,
-                                                  index=picklist_col_index, key=f"edit_picklist_col_{i}")
-                elif new_transformation == "Custom Python":
-                    new_custom_code = st.text_area("Python Expression", 
-                                                  value=mapping.get('transformation_code', 'value'),
-                                                  key=f"edit_custom_{i}")
-                
-                # Save/Cancel buttons
-                save_col, cancel_col = st.columns(2)
-                with save_col:
-                    if st.button(f"Save Changes {i+1}", key=f"save_{i}"):
-                        # Update the mapping
-                        current_mappings[i].update({
-                            'applies_to': new_applies_to,
-                            'source_file': new_source_file,
-                            'source_column': new_source_col,
-                            'transformation': new_transformation,
-                            'default_value': new_default_val,
-                            'picklist_source': new_picklist_file,
-                            'picklist_column': new_picklist_col,
-                            'transformation_code': TRANSFORMATION_LIBRARY.get(new_transformation, "value")
-                        })
-                        
-                        if new_transformation == "Concatenate":
-                            current_mappings[i]['secondary_column'] = new_second_col
-                        elif new_transformation == "Custom Python":
-                            current_mappings[i]['transformation_code'] = new_custom_code
-                        
-                        save_config_with_session_state("column_mappings", current_mappings)
-                        del st.session_state[f'editing_mapping_{i}']
-                        st.success(f"Mapping {i+1} updated!")
-                        st.rerun()
-                
-                with cancel_col:
-                    if st.button(f"Cancel Edit {i+1}", key=f"cancel_{i}"):
-                        del st.session_state[f'editing_mapping_{i}']
-                        st.rerun()
+                    if new_transformation == "Concatenate":
+                        current_mappings[i]['secondary_column'] = new_second_col
+                    elif new_transformation == "Custom Python":
+                        current_mappings[i]['transformation_code'] = new_custom_code
+                    
+                    save_config_with_session_state("column_mappings", current_mappings)
+                    del st.session_state[f'editing_mapping_{i}']
+                    st.success(f"Mapping {i+1} updated!")
+                    st.rerun()
             
-            st.markdown("---")
+            with cancel_col:
+                if st.button(f"Cancel Edit {i+1}", key=f"cancel_{i}"):
+                    del st.session_state[f'editing_mapping_{i}']
+                    st.rerun()
 
 def show_admin_panel(state=None) -> None:
     """Main admin panel interface with professional styling."""
@@ -1006,8 +1281,11 @@ def show_admin_panel(state=None) -> None:
     # Initialize directories
     initialize_directories()
     
-    # Sync existing configs to session state
-    sync_session_state_on_load()
+    # Sync existing configs to session state once per session; saves keep it current
+    # afterwards and "Force Sync Session State" re-reads the files on demand
+    if not st.session_state.get('admin_configs_synced', False):
+        sync_session_state_on_load()
+        st.session_state['admin_configs_synced'] = True
     
     # Show configuration status at top
     show_configuration_status()
@@ -1027,7 +1305,7 @@ def show_admin_panel(state=None) -> None:
         st.info("Upload sample files to discover available columns for mapping configuration")
         
         source_file_type = st.radio("Select source file type:", 
-                                  ["HRP1000", "HRP1001"],
+                                  SOURCE_FILE_TYPES,
                                   horizontal=True)
         
         uploaded_file = st.file_uploader(
@@ -1040,31 +1318,30 @@ def show_admin_panel(state=None) -> None:
         if uploaded_file:
             process_uploaded_file(uploaded_file, source_file_type)
         
-        # Show current sample information
-        sample_path = os.path.join(SOURCE_SAMPLES_DIR, f"{source_file_type}_sample.csv")
-        if os.path.exists(sample_path):
-            st.subheader("Current Sample Information")
-            try:
-                df = pd.read_csv(sample_path)
-                st.success(f"Current sample: {len(df)} rows, {len(df.columns)} columns")
-                
-                is_valid, message = validate_sample_columns(source_file_type, df)
-                if is_valid:
-                    st.success(f"{message}")
-                else:
-                    st.error(f"{message}")
-                
-                # Show columns in a simple format
-                st.markdown("**Available Columns:**")
-                cols = st.columns(3)
-                for i, col in enumerate(df.columns):
-                    with cols[i % 3]:
-                        st.write(f"• {col}")
-                
-            except Exception as e:
-                st.error(f"Error loading sample: {str(e)}")
-        else:
+        # Show current sample information; row count and columns come from the Parquet footer (legacy CSV samples are scanned)
+        sample_path = saved_sample_path(source_file_type)
+        try:
+            row_count, sample_columns = _read_sample_info(sample_path, file_version(sample_path))
+        except FileNotFoundError:
             st.info(f"No sample file uploaded for {source_file_type} yet")
+        except Exception as e:
+            st.error(f"Error loading sample: {str(e)}")
+        else:
+            st.subheader("Current Sample Information")
+            st.success(f"Current sample: {row_count} rows, {len(sample_columns)} columns")
+            
+            is_valid, message = validate_sample_columns(source_file_type, sample_columns)
+            if is_valid:
+                st.success(f"{message}")
+            else:
+                st.error(f"{message}")
+            
+            # Show columns in a simple format
+            st.markdown("**Available Columns:**")
+            cols = st.columns(3)
+            for i, col in enumerate(sample_columns):
+                with cols[i % 3]:
+                    st.write(f"• {col}")
 
     with tab2:
         st.markdown("### Configure Output Templates")
@@ -1132,8 +1409,8 @@ def show_admin_panel(state=None) -> None:
     health_items = [
         ("Templates", bool(load_config("level") and load_config("association"))),
         ("Mappings", bool(load_config("column_mappings"))),
-        ("Picklists", os.path.exists(PICKLIST_DIR) and any(f.endswith('.csv') for f in os.listdir(PICKLIST_DIR))),
-        ("Samples", os.path.exists(SOURCE_SAMPLES_DIR) and any(f.endswith('.csv') for f in os.listdir(SOURCE_SAMPLES_DIR)))
+        ("Picklists", any(f.endswith('.csv') for f in list_dir_files(PICKLIST_DIR))),
+        ("Samples", bool(saved_sample_sources(list_dir_files(SOURCE_SAMPLES_DIR))))
     ]
     
     for item, status in health_items:
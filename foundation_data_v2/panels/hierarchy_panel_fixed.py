@@ -6,6 +6,7 @@ import re
 import io
 from openpyxl import Workbook
 from openpyxl.utils.dataframe import dataframe_to_rows
+from foundation_data_v2.utils.hierarchy_utils import compile_transformation
 
 def load_mapping_configuration(state):
     """Load and parse the mapping configuration from admin panel with better debugging"""
@@ -34,18 +35,17 @@ def load_mapping_configuration(state):
         
         # Try to load from file system as fallback
         try:
-            import json
-            import os
-            config_path = "configs/column_mappings_config.json"
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    config_data = json.load(f)
-                    if config_data:
-                        df_config = pd.DataFrame(config_data)
-                        # Also sync to session state for next time
-                        st.session_state['mapping_config'] = df_config
-                        st.info("Loaded mapping configuration from file system")
-                        return df_config
+            from pathlib import Path
+            from foundation_data_v2.utils.json_utils import loads_json
+            config_data = loads_json(Path("configs/column_mappings_config.json").read_bytes())
+            if config_data:
+                df_config = pd.DataFrame(config_data)
+                # Also sync to session state for next time
+                st.session_state['mapping_config'] = df_config
+                st.info("Loaded mapping configuration from file system")
+                return df_config
+        except FileNotFoundError:
+            pass
         except Exception as e:
             st.warning(f"Could not load from file system: {str(e)}")
         
@@ -266,7 +266,7 @@ def apply_transformation(value, transformation, mapping_config=None, source_row=
                 }
                 
                 # Execute the custom code
-                result = eval(custom_code, {"__builtins__": {}}, exec_env)
+                result = eval(compile_transformation(custom_code), {"__builtins__": {}}, exec_env)
                 return result
                 
             except Exception as e:
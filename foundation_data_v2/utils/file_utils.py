@@ -20,6 +20,10 @@ def load_data(file):
     except Exception as e:
         raise ValueError(f"Error loading file: {str(e)}")
 
+def read_picklist_csv(path):
+    """Read a picklist CSV with every cell as written: text columns, blank cells as empty strings"""
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
 def create_download_button(data, file_name, file_type):
     """Create a robust download button for DataFrames"""
     if not isinstance(data, pd.DataFrame):
@@ -1,11 +1,12 @@
 
 import pandas as pd
 import networkx as nx
-import json
 import os
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 import sys
+from foundation_data_v2.utils.json_utils import loads_json
 
 # Set recursion limit higher
 sys.setrecursionlimit(10000)
@@ -13,10 +14,10 @@ sys.setrecursionlimit(10000)
 def load_config(config_type):
     """Load configuration from JSON files with fallback to defaults"""
     try:
-        config_path = f"configs/{config_type}_config.json"
-        if os.path.exists(config_path):
-            with open(config_path, "r") as f:
-                return json.load(f)
+        raw = Path(f"configs/{config_type}_config.json").read_bytes()
+        return loads_json(raw)
+    except FileNotFoundError:
+        pass
     except Exception as e:
         print(f"Error loading config {config_type}: {e}")
     return None
@@ -60,22 +61,31 @@ def convert_german_date(value):
     except:
         return str(value) if value else ''
 
+# Source status codes translated before looking them up in status_mapping.csv
+STATUS_CODE_MAP = {
+    '1': 'ACT',
+    '2': 'INA',
+    '3': 'PND',
+    '0': 'DEL'
+}
+
+@lru_cache(maxsize=32)
+def _load_picklist(picklist_path, mtime):
+    """Read a picklist once per (path, mtime) instead of once per looked-up cell"""
+    # Picklist columns are low-cardinality codes/labels; categoricals keep them compact
+    return pd.read_csv(picklist_path, dtype="category")
+
 def lookup_value(value, picklist_name, picklist_column="", default=""):
     """Helper for picklist lookups with your status mapping"""
     try:
-        if not picklist_name or not os.path.exists(f"picklists/{picklist_name}"):
+        picklist_path = f"picklists/{picklist_name}"
+        if not picklist_name or not os.path.exists(picklist_path):
             return default
             
-        picklist = pd.read_csv(f"picklists/{picklist_name}")
+        picklist = _load_picklist(picklist_path, os.path.getmtime(picklist_path))
         
         if picklist_name == "status_mapping.csv":
-            status_map = {
-                '1': 'ACT',
-                '2': 'INA',
-                '3': 'PND',
-                '0': 'DEL'
-            }
-            lookup_value = status_map.get(str(value), str(value))
+            lookup_value = STATUS_CODE_MAP.get(str(value), str(value))
         else:
             lookup_value = str(value)
         
@@ -92,6 +102,34 @@ def lookup_value(value, picklist_name, picklist_column="", default=""):
         print(f"Picklist lookup error: {e}")
         return default
 
+def lookup_values(values, picklist_name, picklist_column="", default=""):
+    """Vectorized lookup_value for a whole Series of source values"""
+    try:
+        picklist_path = f"picklists/{picklist_name}"
+        if not picklist_name or not os.path.exists(picklist_path):
+            return pd.Series(default, index=values.index)
+        
+        picklist = _load_picklist(picklist_path, os.path.getmtime(picklist_path))
+        
+        # str() per value, as lookup_value does: missing cells become 'nan'/'None', not NaN
+        keys = values.map(str)
+        if picklist_name == "status_mapping.csv":
+            keys = keys.map(lambda v: STATUS_CODE_MAP.get(v, v))
+        
+        result_column = picklist_column if picklist_column and picklist_column in picklist.columns else 'status_label'
+        # First matching row wins, as in lookup_value
+        first_matches = picklist.drop_duplicates('status_code').set_index('status_code')[result_column].astype(object)
+        
+        return keys.map(first_matches).where(keys.isin(first_matches.index), default)
+    except Exception as e:
+        print(f"Picklist lookup error: {e}")
+        return pd.Series(default, index=values.index)
+
+@lru_cache(maxsize=256)
+def compile_transformation(transformation_code):
+    """Compile a transformation expression once; the code object is reused for every row"""
+    return compile(transformation_code, "<transformation>", "eval")
+
 def apply_transformation(value, transformation_code, secondary_value=None):
     """Apply transformation code to value"""
     try:
@@ -106,9 +144,9 @@ def apply_transformation(value, transformation_code, secondary_value=None):
         
         if secondary_value is not None and not pd.isna(secondary_value):
             value1, value2 = value, secondary_value
-            return eval(transformation_code)
+            return eval(compile_transformation(transformation_code))
         else:
-            return eval(transformation_code)
+            return eval(compile_transformation(transformation_code))
     except Exception as e:
         print(f"Transformation error: {e}")
         return value
@@ -154,9 +192,7 @@ def apply_mappings(df, mappings, export_type, hrp1000_df=None, hrp1001_df=None):
             source_values = pd.Series([default_value] * len(df))
         
         if transformation == "Lookup Value" and picklist_source:
-            result_df[target_col] = source_values.apply(
-                lambda x: lookup_value(x, picklist_source, picklist_column, default_value)
-            )
+            result_df[target_col] = lookup_values(source_values, picklist_source, picklist_column, default_value)
         elif transformation == "Date Format (YYYY-MM-DD)":
             result_df[target_col] = source_values.apply(convert_german_date)
         elif transformation != "None":
@@ -0,0 +1,22 @@
+import json
+
+# orjson is optional; fall back to the stdlib json module when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def loads_json(raw):
+    """Parse JSON bytes or text, with orjson when it is installed"""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def dumps_json(obj, indent=False):
+    """Serialize to UTF-8 JSON bytes: 2-space indented, or compact when indent is False"""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+
+from foundation_data_v2.utils.hierarchy_utils import lookup_value, lookup_values
+
+
+def test_lookup_values_matches_lookup_value_with_missing_values(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "picklists").mkdir()
+    # The blank status_code row must not catch missing source values
+    (tmp_path / "picklists" / "statuses.csv").write_text(
+        "status_code,status_label\n,Empty\nA,Active\nI,Inactive\nA,Duplicate\n"
+    )
+    values = pd.Series(["A", np.nan, "I", None, "X", 1.0], dtype=object)
+
+    result = lookup_values(values, "statuses.csv", default="DEF")
+
+    expected = [lookup_value(v, "statuses.csv", default="DEF") for v in values]
+    assert result.tolist() == expected
+    assert expected == ["Active", "DEF", "Inactive", "DEF", "DEF", "DEF"]